@@ -1,5 +1,73 @@
+from functools import lru_cache
+
 import numpy as np
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+@lru_cache(maxsize=None)
+def _make_construct_kernel(m, n):
+    """
+    Build the numeric core of the greedy construction for a fixed instance
+    shape. `m` and `n` are captured in the closure, so when numba compiles
+    the kernel they become compile-time constants and LLVM can specialize
+    the loop trip counts. lru_cache keeps one compiled kernel per shape,
+    amortizing compilation across repeated construct() calls.
+    """
+
+    def kernel(capacities, demands, fixed_costs, assignment_costs,
+               order, total_demand):
+        # `order` is the precomputed efficiency-ratio ordering. Returns
+        # (open_idx, best_facility, facility_demand, total_fixed, total_assign).
+        open_count = 0
+        opened_capacity = 0.0
+        for s in range(m):
+            if opened_capacity >= total_demand:
+                break
+            opened_capacity += capacities[order[s]]
+            open_count += 1
+
+        open_idx = order[:open_count]
+
+        # Customer argmins are independent, so the scan parallelizes
+        # across customers; each iteration only writes its own slot.
+        best_facility = np.empty(n, dtype=np.int64)
+        best_costs = np.empty(n, dtype=np.float64)
+        for j in prange(n):
+            best_i = open_idx[0]
+            best_cost = assignment_costs[best_i, j]
+            for s in range(1, open_count):
+                i = open_idx[s]
+                cost = assignment_costs[i, j]
+                # Branchless select: conditional expressions lower to CMOV /
+                # min instructions instead of an unpredictable branch when
+                # many facilities have near-identical costs.
+                better = cost < best_cost
+                best_i = i if better else best_i
+                best_cost = cost if better else best_cost
+            best_facility[j] = best_i
+            best_costs[j] = best_cost
+
+        # Serial O(n) reduction avoids races on the shared demand array
+        facility_demand = np.zeros(m, dtype=np.float64)
+        total_assign = 0.0
+        for j in range(n):
+            facility_demand[best_facility[j]] += demands[j]
+            total_assign += best_costs[j]
+
+        total_fixed = 0.0
+        for s in range(open_count):
+            total_fixed += fixed_costs[open_idx[s]]
+
+        return open_idx, best_facility, facility_demand, total_fixed, total_assign
+
+    return njit(parallel=True)(kernel) if NUMBA_AVAILABLE else kernel
+
 
 class SSCFLPInitialSolution:
     """
@@ -29,11 +97,21 @@ class SSCFLPInitialSolution:
         """
         self.num_facilities = num_facilities
         self.num_customers = num_customers
-        self.capacities = capacities
-        self.demands = demands
-        self.fixed_costs = fixed_costs
-        self.assignment_costs = assignment_costs
-        
+        # Canonical C-contiguous float64 copies: the vectorized and njit
+        # construction paths both rely on this dtype and layout.
+        self.capacities = np.ascontiguousarray(capacities, dtype=np.float64)
+        self.demands = np.ascontiguousarray(demands, dtype=np.float64)
+        self.fixed_costs = np.ascontiguousarray(fixed_costs, dtype=np.float64)
+        self.assignment_costs = np.ascontiguousarray(assignment_costs, dtype=np.float64)
+        # Customer-major (n x m) view so per-customer cost scans are unit-stride
+        self._costs_cn = np.ascontiguousarray(self.assignment_costs.T)
+
+        # The opening order is instance data, not solution state: compute
+        # it once so repeated construct() calls skip the sort and sums.
+        self._sorted_facilities = np.argsort(self.fixed_costs / self.capacities)
+        self._capacity_cumsum = np.cumsum(self.capacities[self._sorted_facilities])
+        self._total_demand = float(self.demands.sum())
+
         # Solution variables (will be set after construct)
         self.open_facilities = None
         self.assignments = None
@@ -42,7 +120,18 @@ class SSCFLPInitialSolution:
         self.total_cost = None
         self.is_feasible = None
         self.capacity_violations = None
-        
+        self.facility_demand = None
+
+    @property
+    def assignments_dict(self):
+        """
+        Customer -> facility mapping as a plain dict, for callers that
+        still expect the old dictionary form.
+        """
+        if self.assignments is None:
+            return None
+        return dict(enumerate(self.assignments.tolist()))
+
     def construct(self):
         """
         Execute the greedy construction heuristic.
@@ -57,68 +146,61 @@ class SSCFLPInitialSolution:
         dict
             Dictionary containing solution details:
             - open_facilities: List of facility indices that are open
-            - assignments: Dictionary mapping customer j to facility i
+            - assignments: Array where entry j is the facility of customer j
             - total_fixed_cost: Sum of fixed costs for open facilities
             - total_assignment_cost: Sum of assignment costs
             - total_cost: Total cost (fixed + assignment)
             - is_feasible: Boolean indicating if solution is feasible
             - capacity_violations: Dictionary of facility overloads
         """
-        # Step 1: Calculate efficiency ratio R_i = f_i / b_i for each facility
-        efficiency_ratios = self.fixed_costs / self.capacities
-        
-        # Step 2: Sort facilities by efficiency ratio (ascending order)
-        sorted_facilities = np.argsort(efficiency_ratios)
-        
-        # Step 3: Open facilities until total capacity >= total demand
-        total_demand = np.sum(self.demands)
-        self.open_facilities = []
-        total_capacity_opened = 0
-        
-        for facility_idx in sorted_facilities:
-            if total_capacity_opened >= total_demand:
-                break
-            self.open_facilities.append(int(facility_idx))
-            total_capacity_opened += self.capacities[facility_idx]
-        
-        # Convert to set for faster lookup
-        open_facilities_set = set(self.open_facilities)
-        
-        # Step 4: Assign each customer to the nearest (cheapest) open facility
-        self.assignments = {}
-        facility_demand = np.zeros(self.num_facilities)  # Track demand assigned to each facility
-        
-        for j in range(self.num_customers):
-            # Find the cheapest assignment cost among open facilities
-            min_cost = float('inf')
-            best_facility = None
-            
-            for i in self.open_facilities:
-                if self.assignment_costs[i][j] < min_cost:
-                    min_cost = self.assignment_costs[i][j]
-                    best_facility = i
-            
-            # Assign customer j to best_facility
-            if best_facility is not None:
-                self.assignments[j] = best_facility
-                facility_demand[best_facility] += self.demands[j]
-        
-        # Step 5: Calculate costs
-        self.total_fixed_cost = sum(self.fixed_costs[i] for i in self.open_facilities)
-        self.total_assignment_cost = sum(
-            self.assignment_costs[self.assignments[j]][j] 
-            for j in range(self.num_customers)
-        )
+        if NUMBA_AVAILABLE:
+            # Shape-specialized compiled kernel handles steps 1-5 on typed
+            # arrays only; conversion to Python structures stays here.
+            kernel = _make_construct_kernel(self.num_facilities, self.num_customers)
+            (open_idx, best_facility, facility_demand,
+             total_fixed, total_assign) = kernel(
+                self.capacities, self.demands, self.fixed_costs,
+                self.assignment_costs, self._sorted_facilities, self._total_demand
+            )
+        else:
+            # Step 1-3: Open facilities (in precomputed efficiency-ratio
+            # order) until total capacity >= total demand; the cached
+            # cumulative capacity locates the cutoff in one searchsorted.
+            cutoff = int(np.searchsorted(self._capacity_cumsum, self._total_demand)) + 1
+            cutoff = min(cutoff, self.num_facilities)
+            open_idx = self._sorted_facilities[:cutoff]
+
+            # Step 4: Assign each customer to the nearest (cheapest) open
+            # facility; the customer-major view keeps the argmin unit-stride.
+            cost_sub = self._costs_cn[:, open_idx]  # shape (n, |open|)
+            best_local = np.argmin(cost_sub, axis=1)
+            best_facility = open_idx[best_local]
+            facility_demand = np.bincount(
+                best_facility, weights=self.demands, minlength=self.num_facilities
+            )
+
+            # Step 5: Calculate costs; the chosen costs were already
+            # gathered for the argmin, so no extra pass is needed.
+            min_costs = cost_sub[np.arange(self.num_customers), best_local]
+            total_fixed = float(self.fixed_costs[open_idx].sum())
+            total_assign = float(min_costs.sum())
+
+        self.open_facilities = open_idx.tolist()
+        self.facility_demand = facility_demand
+        # Dense array: assignments form a total function over 0..n-1, so a
+        # dict of boxed ints is pure overhead for downstream scans.
+        self.assignments = best_facility.astype(np.int32)
+        self.total_fixed_cost = float(total_fixed)
+        self.total_assignment_cost = float(total_assign)
         self.total_cost = self.total_fixed_cost + self.total_assignment_cost
-        
-        # Step 6: Check feasibility and capacity violations
-        self.capacity_violations = {}
-        for i in self.open_facilities:
-            if facility_demand[i] > self.capacities[i]:
-                violation = facility_demand[i] - self.capacities[i]
-                self.capacity_violations[i] = violation
-        
-        self.is_feasible = len(self.capacity_violations) == 0
+
+        # Step 6: Check feasibility and capacity violations in one masked pass
+        overload = facility_demand[open_idx] - self.capacities[open_idx]
+        violated = overload > 0
+        self.capacity_violations = dict(
+            zip(open_idx[violated].tolist(), overload[violated].tolist())
+        )
+        self.is_feasible = not violated.any()
         
         # Return solution summary
         return {
@@ -137,35 +219,36 @@ class SSCFLPInitialSolution:
         """
         if self.open_facilities is None:
             raise ValueError("Solution not constructed yet. Call construct() first.")
-        
-        print("=" * 60)
-        print("SSCFLP INITIAL SOLUTION SUMMARY")
-        print("=" * 60)
-        print(f"\nTotal Cost: {self.total_cost:.2f}")
-        print(f"  - Fixed Costs: {self.total_fixed_cost:.2f}")
-        print(f"  - Assignment Costs: {self.total_assignment_cost:.2f}")
-        
-        print(f"\nFeasibility: {'FEASIBLE' if self.is_feasible else 'INFEASIBLE'}")
-        
+
+        # Buffer everything and emit once; per-line print costs a flush
+        lines = []
+        lines.append("=" * 60)
+        lines.append("SSCFLP INITIAL SOLUTION SUMMARY")
+        lines.append("=" * 60)
+        lines.append(f"\nTotal Cost: {self.total_cost:.2f}")
+        lines.append(f"  - Fixed Costs: {self.total_fixed_cost:.2f}")
+        lines.append(f"  - Assignment Costs: {self.total_assignment_cost:.2f}")
+
+        lines.append(f"\nFeasibility: {'FEASIBLE' if self.is_feasible else 'INFEASIBLE'}")
+
         if not self.is_feasible:
-            print(f"\nCapacity Violations: {len(self.capacity_violations)} facility(ies) overloaded")
+            lines.append(f"\nCapacity Violations: {len(self.capacity_violations)} facility(ies) overloaded")
             for facility, violation in self.capacity_violations.items():
-                print(f"  Facility {facility}: Exceeds capacity by {violation:.2f}")
-        
-        print(f"\nOpen Facilities: {len(self.open_facilities)}")
-        print(f"Facility Indices: {self.open_facilities}")
-        
-        # Calculate capacity utilization
-        facility_demand = np.zeros(self.num_facilities)
-        for j, i in self.assignments.items():
-            facility_demand[i] += self.demands[j]
-        
-        print(f"\nFacility Capacity Utilization:")
+                lines.append(f"  Facility {facility}: Exceeds capacity by {violation:.2f}")
+
+        lines.append(f"\nOpen Facilities: {len(self.open_facilities)}")
+        lines.append(f"Facility Indices: {self.open_facilities}")
+
+        # Capacity utilization comes from the loads cached by construct()
+        facility_demand = self.facility_demand
+
+        lines.append(f"\nFacility Capacity Utilization:")
         for i in self.open_facilities:
             used = facility_demand[i]
             total = self.capacities[i]
             pct = (used / total * 100) if total > 0 else 0
             status = "OVERLOADED" if i in self.capacity_violations else "OK"
-            print(f"  Facility {i}: {used:.2f} / {total:.2f} ({pct:.2f}%) - {status}")
-        
-        print("=" * 60)
\ No newline at end of file
+            lines.append(f"  Facility {i}: {used:.2f} / {total:.2f} ({pct:.2f}%) - {status}")
+
+        lines.append("=" * 60)
+        print("\n".join(lines))
\ No newline at end of file
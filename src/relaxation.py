@@ -1,6 +1,13 @@
 import numpy as np
 import pulp
 
+try:
+    from scipy import sparse
+    from scipy.optimize import linprog
+    SCIPY_AVAILABLE = True
+except ImportError:  # scipy is an optional accelerator
+    SCIPY_AVAILABLE = False
+
 
 class SSCFLPLowerBound:
     """
@@ -30,26 +37,142 @@ class SSCFLPLowerBound:
         """
         self.num_facilities = num_facilities
         self.num_customers = num_customers
-        self.capacities = capacities
-        self.demands = demands
-        self.fixed_costs = fixed_costs
-        self.assignment_costs = assignment_costs
+        # Canonical C-contiguous float64 copies so model construction
+        # works on a fixed dtype/layout regardless of the caller's input.
+        self.capacities = np.ascontiguousarray(capacities, dtype=np.float64)
+        self.demands = np.ascontiguousarray(demands, dtype=np.float64)
+        self.fixed_costs = np.ascontiguousarray(fixed_costs, dtype=np.float64)
+        self.assignment_costs = np.ascontiguousarray(assignment_costs, dtype=np.float64)
         
         # Solution variables (will be set after solve)
         self.x = None
         self.y = None
         self.prob = None
         self.objective_value = None
-        
-    def solve(self):
+        self.x_val = None
+        self.y_val = None
+
+    def solve(self, use_scipy=None, solver=None, warm_start=None):
         """
         Solve the LP relaxation of the SSCFLP problem.
-        
+
+        Parameters:
+        -----------
+        use_scipy : bool or None
+            If True, build the LP as sparse matrices and solve with
+            scipy's HiGHS interface (much faster model construction than
+            PuLP). If None (default), scipy is used when installed.
+            Set False to force the PuLP path, e.g. for debugging.
+        solver : pulp solver or None
+            Solver for the PuLP path. Defaults to HiGHS when the PuLP
+            installation provides it, otherwise CBC. Ignored when the
+            scipy path is taken.
+        warm_start : tuple or None
+            Optional (y_init, x_init) primal start, e.g. derived from
+            SSCFLPInitialSolution: y_init is a length-m array of open
+            indicators and x_init an (m, n) array of assignment
+            fractions. Passed to the solver via PuLP's warmStart
+            mechanism; only honored on the PuLP path (scipy's HiGHS
+            interface takes no primal start), which is forced when a
+            warm start is supplied.
+
         Returns:
         --------
         float
             The optimized objective function value (lower bound)
         """
+        if use_scipy is None:
+            use_scipy = SCIPY_AVAILABLE and warm_start is None
+        if use_scipy:
+            return self._solve_scipy()
+        return self._solve_pulp(solver, warm_start)
+
+    def _solve_scipy(self):
+        """
+        Matrix-based LP build solved with HiGHS via scipy.optimize.linprog.
+
+        Variables are flattened as x[i*n + j] followed by y[i], so the
+        model is a handful of sparse-matrix constructions instead of
+        O(m*n) PuLP expression objects.
+        """
+        m, n = self.num_facilities, self.num_customers
+        num_x = m * n
+
+        # Objective: assignment costs over x, fixed costs over y
+        c = np.concatenate([self.assignment_costs.ravel(), self.fixed_costs])
+
+        # Constraint 1 (equality): each customer fully served
+        # Row j has a 1 for every x[i*n + j]
+        rows = np.arange(num_x) % n
+        cols = np.arange(num_x)
+        a_eq = sparse.csr_matrix((np.ones(num_x), (rows, cols)), shape=(n, num_x + m))
+        b_eq = np.ones(n)
+
+        # Constraint 2: capacity - sum_j d_j*x[i,j] - b_i*y_i <= 0
+        cap_rows = np.concatenate([np.arange(num_x) // n, np.arange(m)])
+        cap_cols = np.concatenate([np.arange(num_x), num_x + np.arange(m)])
+        cap_data = np.concatenate([np.tile(self.demands, m), -self.capacities])
+        a_cap = sparse.csr_matrix((cap_data, (cap_rows, cap_cols)), shape=(m, num_x + m))
+
+        # Constraint 3: strong linking x[i,j] <= y[i], added lazily.
+        # The aggregated capacity constraint already links x to y, so the
+        # LP is solved without the O(m*n) linking rows and only rows
+        # violated by the current optimum are separated and re-added
+        # (cutting-plane style). The bound is identical at convergence.
+        cut_x = np.empty(0, dtype=np.intp)  # flat x indices with a cut
+        while True:
+            if cut_x.size:
+                num_cuts = cut_x.size
+                link_rows = np.concatenate([np.arange(num_cuts), np.arange(num_cuts)])
+                link_cols = np.concatenate([cut_x, num_x + cut_x // n])
+                link_data = np.concatenate([np.ones(num_cuts), -np.ones(num_cuts)])
+                a_link = sparse.csr_matrix((link_data, (link_rows, link_cols)),
+                                           shape=(num_cuts, num_x + m))
+                a_ub = sparse.vstack([a_cap, a_link], format='csr')
+                b_ub = np.zeros(m + num_cuts)
+            else:
+                a_ub = a_cap
+                b_ub = np.zeros(m)
+
+            result = linprog(c, A_ub=a_ub, b_ub=b_ub, A_eq=a_eq, b_eq=b_eq,
+                             bounds=(0, 1), method='highs')
+            if not result.success:
+                raise RuntimeError(f"LP relaxation failed: {result.message}")
+
+            x_flat = result.x[:num_x]
+            y_vec = result.x[num_x:]
+            violated = np.flatnonzero(x_flat > y_vec[np.arange(num_x) // n] + 1e-6)
+            new_cuts = np.setdiff1d(violated, cut_x)
+            if new_cuts.size == 0:
+                break
+            cut_x = np.union1d(cut_x, new_cuts)
+
+        self.x_val = x_flat.reshape(m, n)
+        self.y_val = y_vec
+        self.objective_value = float(result.fun)
+        return self.objective_value
+
+    def _default_pulp_solver(self, warm_start=False):
+        """
+        Prefer HiGHS for the continuous relaxation (markedly faster than
+        CBC's CLP on LPs); fall back to CBC when HiGHS is not installed.
+        When a warm start is requested the solver is created with
+        PuLP's warmStart option so initial variable values are passed on.
+        """
+        try:
+            solver = pulp.HiGHS_CMD(msg=0, warmStart=warm_start)
+            if solver.available():
+                return solver
+        except Exception:
+            pass
+        return pulp.PULP_CBC_CMD(msg=0, warmStart=warm_start)
+
+    def _solve_pulp(self, solver=None, warm_start=None):
+        """
+        Original PuLP model build, solved with HiGHS or CBC.
+        """
+        if solver is None:
+            solver = self._default_pulp_solver(warm_start=warm_start is not None)
         # Initialize the problem
         self.prob = pulp.LpProblem("SSCFLP_LowerBound", pulp.LpMinimize)
         
@@ -63,35 +186,68 @@ class SSCFLPLowerBound:
         self.y = [pulp.LpVariable(f"y_{i}", lowBound=0, upBound=1, cat='Continuous')
              for i in range(self.num_facilities)]
         
-        # Objective function: Minimize Fixed Costs + Assignment Costs
-        self.prob += (pulp.lpSum([self.fixed_costs[i] * self.y[i] for i in range(self.num_facilities)]) +
-                 pulp.lpSum([self.assignment_costs[i][j] * self.x[i][j] 
-                            for i in range(self.num_facilities)
-                            for j in range(self.num_customers)]))
-        
+        # Objective function: Minimize Fixed Costs + Assignment Costs.
+        # Building LpAffineExpression from {var: coef} dicts skips PuLP's
+        # per-term accumulation path.
+        self.prob += pulp.LpAffineExpression(
+            {self.y[i]: float(self.fixed_costs[i]) for i in range(self.num_facilities)}
+            | {self.x[i][j]: float(self.assignment_costs[i][j])
+               for i in range(self.num_facilities)
+               for j in range(self.num_customers)}
+        )
+
         # Constraint 1: Assignment - Each customer must be fully served
         for j in range(self.num_customers):
-            self.prob += pulp.lpSum([self.x[i][j] for i in range(self.num_facilities)]) == 1
-        
+            self.prob += pulp.LpAffineExpression(
+                {self.x[i][j]: 1.0 for i in range(self.num_facilities)}
+            ) == 1
+
         # Constraint 2: Capacity - Total demand served by facility i cannot exceed capacity * y_i
         for i in range(self.num_facilities):
-            self.prob += (pulp.lpSum([self.demands[j] * self.x[i][j] for j in range(self.num_customers)]) 
-                    <= self.capacities[i] * self.y[i])
-        
-        # Constraint 3: Strong Linking - x[i][j] <= y[i] for all i, j
-        for i in range(self.num_facilities):
-            for j in range(self.num_customers):
+            self.prob += pulp.LpAffineExpression(
+                {self.x[i][j]: float(self.demands[j]) for j in range(self.num_customers)}
+                | {self.y[i]: -float(self.capacities[i])}
+            ) <= 0
+        
+        # Seed the solver with the caller's primal solution, if provided
+        if warm_start is not None:
+            y_init, x_init = warm_start
+            for i in range(self.num_facilities):
+                self.y[i].setInitialValue(min(1.0, max(0.0, float(y_init[i]))))
+                for j in range(self.num_customers):
+                    self.x[i][j].setInitialValue(
+                        min(1.0, max(0.0, float(x_init[i][j])))
+                    )
+
+        # Constraint 3: Strong Linking x[i][j] <= y[i] is separated lazily
+        # below instead of adding all m*n rows upfront; the aggregated
+        # capacity constraint already links x to y.
+        added_cuts = set()
+        while True:
+            # Solve the problem (suppress output)
+            self.prob.solve(solver)
+
+            # Cache solution values as arrays for the accessors
+            self.x_val = np.array([[pulp.value(self.x[i][j]) or 0.0
+                                    for j in range(self.num_customers)]
+                                   for i in range(self.num_facilities)])
+            self.y_val = np.array([pulp.value(v) or 0.0 for v in self.y])
+
+            # Re-add only the linking constraints the optimum violates
+            violated = np.argwhere(self.x_val > self.y_val[:, None] + 1e-6)
+            new_cuts = [(i, j) for i, j in violated.tolist() if (i, j) not in added_cuts]
+            if not new_cuts:
+                break
+            for i, j in new_cuts:
                 self.prob += self.x[i][j] <= self.y[i]
-        
-        # Solve the problem (suppress output)
-        self.prob.solve(pulp.PULP_CBC_CMD(msg=0))
-        
+                added_cuts.add((i, j))
+
         # Store the objective value
         self.objective_value = pulp.value(self.prob.objective)
-        
+
         # Return the objective value
         return self.objective_value
-    
+
     def get_open_facilities(self, threshold=1e-6):
         """
         Get list of open facilities (y[i] > threshold).
@@ -106,15 +262,10 @@ class SSCFLPLowerBound:
         list
             List of facility indices that are open
         """
-        if self.y is None:
+        if self.y_val is None:
             raise ValueError("Problem not solved yet. Call solve() first.")
         
-        open_facilities = []
-        for i in range(self.num_facilities):
-            y_value = pulp.value(self.y[i])
-            if y_value is not None and y_value > threshold:
-                open_facilities.append(i)
-        return open_facilities
+        return np.flatnonzero(self.y_val > threshold).tolist()
     
     def get_customer_assignments(self, threshold=1e-6):
         """
@@ -130,17 +281,12 @@ class SSCFLPLowerBound:
         dict
             Dictionary mapping customer index to list of (facility_index, assignment_fraction) tuples
         """
-        if self.x is None:
+        if self.x_val is None:
             raise ValueError("Problem not solved yet. Call solve() first.")
         
-        assignments = {}
-        for j in range(self.num_customers):
-            customer_assignments = []
-            for i in range(self.num_facilities):
-                x_value = pulp.value(self.x[i][j])
-                if x_value is not None and x_value > threshold:
-                    customer_assignments.append((i, x_value))
-            assignments[j] = customer_assignments
+        assignments = {j: [] for j in range(self.num_customers)}
+        for i, j in np.argwhere(self.x_val > threshold).tolist():
+            assignments[j].append((i, float(self.x_val[i][j])))
         return assignments
     
     def get_facility_utilization(self):
@@ -152,17 +298,15 @@ class SSCFLPLowerBound:
         dict
             Dictionary mapping facility index to (used_capacity, total_capacity, utilization_percentage)
         """
-        if self.x is None:
+        if self.x_val is None:
             raise ValueError("Problem not solved yet. Call solve() first.")
         
+        used = self.x_val @ self.demands  # one matvec for all facilities
         utilization = {}
         for i in range(self.num_facilities):
-            used_capacity = sum(pulp.value(self.x[i][j]) * self.demands[j] 
-                               for j in range(self.num_customers)
-                               if pulp.value(self.x[i][j]) is not None)
             total_capacity = self.capacities[i]
-            util_pct = (used_capacity / total_capacity * 100) if total_capacity > 0 else 0
-            utilization[i] = (used_capacity, total_capacity, util_pct)
+            util_pct = (used[i] / total_capacity * 100) if total_capacity > 0 else 0
+            utilization[i] = (float(used[i]), total_capacity, util_pct)
         return utilization
     
     def get_total_demand_satisfied(self):
@@ -185,16 +329,10 @@ class SSCFLPLowerBound:
         float
             Total capacity used
         """
-        if self.x is None:
+        if self.x_val is None:
             raise ValueError("Problem not solved yet. Call solve() first.")
         
-        total_used = 0
-        for i in range(self.num_facilities):
-            for j in range(self.num_customers):
-                x_value = pulp.value(self.x[i][j])
-                if x_value is not None:
-                    total_used += x_value * self.demands[j]
-        return total_used
+        return float((self.x_val @ self.demands).sum())
     
     def print_solution_summary(self, threshold=1e-6):
         """
@@ -207,42 +345,45 @@ class SSCFLPLowerBound:
         """
         if self.objective_value is None:
             raise ValueError("Problem not solved yet. Call solve() first.")
-        
-        print("=" * 60)
-        print("SSCFLP LP RELAXATION SOLUTION SUMMARY")
-        print("=" * 60)
-        print(f"\nObjective Value (Lower Bound): {self.objective_value:.2f}")
-        
+
+        # Buffer everything and emit once; per-line print costs a flush
+        lines = []
+        lines.append("=" * 60)
+        lines.append("SSCFLP LP RELAXATION SOLUTION SUMMARY")
+        lines.append("=" * 60)
+        lines.append(f"\nObjective Value (Lower Bound): {self.objective_value:.2f}")
+
         # Open facilities
         open_facilities = self.get_open_facilities(threshold)
-        print(f"\nOpen Facilities: {len(open_facilities)}")
-        print(f"Facility Indices: {open_facilities}")
-        
+        lines.append(f"\nOpen Facilities: {len(open_facilities)}")
+        lines.append(f"Facility Indices: {open_facilities}")
+
         # Total demand and capacity
         total_demand = self.get_total_demand_satisfied()
         total_capacity_used = self.get_total_capacity_used()
         total_capacity_available = sum(self.capacities)
-        
-        print(f"\nTotal Demand: {total_demand:.2f}")
-        print(f"Total Capacity Used: {total_capacity_used:.2f}")
-        print(f"Total Capacity Available: {total_capacity_available:.2f}")
-        print(f"Capacity Utilization Rate: {total_capacity_used/total_capacity_available*100:.2f}%")
-        
+
+        lines.append(f"\nTotal Demand: {total_demand:.2f}")
+        lines.append(f"Total Capacity Used: {total_capacity_used:.2f}")
+        lines.append(f"Total Capacity Available: {total_capacity_available:.2f}")
+        lines.append(f"Capacity Utilization Rate: {total_capacity_used/total_capacity_available*100:.2f}%")
+
         # Facility utilization
-        print(f"\nFacility Capacity Utilization:")
+        lines.append(f"\nFacility Capacity Utilization:")
         utilization = self.get_facility_utilization()
         for i in open_facilities:
             used, total, pct = utilization[i]
-            print(f"  Facility {i}: {used:.2f} / {total:.2f} ({pct:.2f}%)")
-        
+            lines.append(f"  Facility {i}: {used:.2f} / {total:.2f} ({pct:.2f}%)")
+
         # Customer assignments
-        print(f"\nCustomer Assignments:")
+        lines.append(f"\nCustomer Assignments:")
         assignments = self.get_customer_assignments(threshold)
         for j in range(self.num_customers):
             customer_assigns = assignments[j]
             if customer_assigns:
                 assign_str = ", ".join([f"Facility {i} ({frac:.3f})" for i, frac in customer_assigns])
-                print(f"  Customer {j}: {assign_str}")
-        
-        print("=" * 60)
+                lines.append(f"  Customer {j}: {assign_str}")
+
+        lines.append("=" * 60)
+        print("\n".join(lines))
 
@@ -0,0 +1,151 @@
+"""
+Compiled scoring kernels for the tabu search hot loop.
+
+The functions here take raw NumPy arrays only, so numba can compile them
+when it is installed; without numba they remain valid (if slow) Python,
+and the caller falls back to the vectorized NumPy evaluators instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def score_relocates(sampled, assignments, allowed, prune, demands, capacities,
+                    fixed_costs, costs_cn, load, counts, tabu_expiry,
+                    iteration, alpha, cur_viol, cur_fixed, cur_assign,
+                    best_feasible_obj):
+    """
+    Score every relocate candidate (sampled customers x facilities), apply
+    the tabu/aspiration filter, and reduce to the admissible argmin in one
+    fused loop with no m x |S| temporaries.
+
+    When `prune` is set, `allowed` is an (|S|, m) admissibility mask and
+    facilities outside it are skipped before any delta math; otherwise
+    `allowed` is ignored (a dummy array is fine).
+
+    Returns (best_j, best_k, best_l, best_obj, best_viol); best_j is -1
+    when no candidate is admissible.
+    """
+    ns = sampled.shape[0]
+    m = capacities.shape[0]
+
+    # Per-customer partial results let the outer loop parallelize; the
+    # final reduction over |S| entries is serial and cheap.
+    best_obj_s = np.full(ns, np.inf)
+    best_l_s = np.full(ns, -1, dtype=np.int64)
+    best_viol_s = np.zeros(ns)
+
+    for s in prange(ns):
+        j = sampled[s]
+        k = assignments[j]
+        demand_j = demands[j]
+        cost_jk = costs_cn[j, k]
+        # Terms that do not depend on the target facility
+        viol_k_delta = (
+            max(load[k] - demand_j - capacities[k], 0.0)
+            - max(load[k] - capacities[k], 0.0)
+        )
+        base_fixed = cur_fixed - (fixed_costs[k] if counts[k] == 1 else 0.0)
+        tabu = iteration < tabu_expiry[j, k]
+
+        local_obj = np.inf
+        local_l = -1
+        local_viol = 0.0
+        for l in range(m):
+            if l == k:
+                continue
+            if prune and not allowed[s, l]:
+                continue
+            new_viol = cur_viol + viol_k_delta + (
+                max(load[l] + demand_j - capacities[l], 0.0)
+                - max(load[l] - capacities[l], 0.0)
+            )
+            delta_fixed = fixed_costs[l] if counts[l] == 0 else 0.0
+            new_obj = (
+                base_fixed + delta_fixed
+                + (cur_assign + costs_cn[j, l] - cost_jk)
+                + alpha * new_viol
+            )
+            feasible = new_viol == 0.0
+            # Aspiration: allow tabu if it improves best feasible objective
+            if tabu and not (feasible and new_obj < best_feasible_obj):
+                continue
+            if new_obj < local_obj:
+                local_obj = new_obj
+                local_l = l
+                local_viol = new_viol
+        best_obj_s[s] = local_obj
+        best_l_s[s] = local_l
+        best_viol_s[s] = local_viol
+
+    best_j = -1
+    best_k = -1
+    best_l = -1
+    best_obj = np.inf
+    best_viol = 0.0
+    for s in range(ns):
+        if best_l_s[s] >= 0 and best_obj_s[s] < best_obj:
+            j = sampled[s]
+            best_j = j
+            best_k = assignments[j]
+            best_l = best_l_s[s]
+            best_obj = best_obj_s[s]
+            best_viol = best_viol_s[s]
+    return best_j, best_k, best_l, best_obj, best_viol
+
+
+def score_swaps(j1, j2, k, l, demands, capacities, costs_cn, load,
+                tabu_expiry, iteration, alpha, cur_viol, cur_fixed,
+                cur_assign, best_feasible_obj):
+    """
+    Score swap candidates given as parallel index arrays, with the same
+    fused filter-and-reduce shape as score_relocates. Candidates are
+    independent, so the scoring loop shards across cores via prange.
+
+    Returns (best_idx, best_obj, best_viol); best_idx is -1 when no
+    candidate is admissible.
+    """
+    nc = j1.shape[0]
+    obj = np.empty(nc)
+    viol = np.empty(nc)
+    for c in prange(nc):
+        a, b = j1[c], j2[c]
+        ka, lb = k[c], l[c]
+        delta_assign = (
+            (costs_cn[a, lb] - costs_cn[a, ka]) + (costs_cn[b, ka] - costs_cn[b, lb])
+        )
+        d1, d2 = demands[a], demands[b]
+        new_viol = cur_viol + (
+            max(load[ka] - d1 + d2 - capacities[ka], 0.0)
+            - max(load[ka] - capacities[ka], 0.0)
+            + max(load[lb] - d2 + d1 - capacities[lb], 0.0)
+            - max(load[lb] - capacities[lb], 0.0)
+        )
+        new_obj = cur_fixed + (cur_assign + delta_assign) + alpha * new_viol
+        feasible = new_viol == 0.0
+        tabu = iteration < tabu_expiry[a, ka] or iteration < tabu_expiry[b, lb]
+        # Aspiration: allow tabu if it improves best feasible objective
+        if tabu and not (feasible and new_obj < best_feasible_obj):
+            new_obj = np.inf
+        obj[c] = new_obj
+        viol[c] = new_viol
+
+    best_idx = -1
+    best_obj = np.inf
+    for c in range(nc):
+        if obj[c] < best_obj:
+            best_obj = obj[c]
+            best_idx = c
+    best_viol = viol[best_idx] if best_idx >= 0 else 0.0
+    return best_idx, best_obj, best_viol
+
+
+if NUMBA_AVAILABLE:
+    score_relocates = njit(cache=True, parallel=True)(score_relocates)
+    score_swaps = njit(cache=True, parallel=True)(score_swaps)
@@ -1,10 +1,127 @@
 import math
 import random
-from copy import deepcopy
-from typing import Any, Dict, List, Tuple
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+
+from tabu_kernels import NUMBA_AVAILABLE as KERNELS_AVAILABLE, score_relocates, score_swaps
+
+
+def _eval_relocate(j, k, l, demands, capacities, costs_T, load, counts,
+                   fixed_costs, alpha, cur_viol, cur_fixed, cur_assign):
+    """
+    Score relocating customer j from facility k to l. Positional numeric
+    arguments only, so numba can compile this hot-path helper when
+    available. Returns (new_objective, new_total_violation).
+    """
+    delta_assign = costs_T[j, l] - costs_T[j, k]
+
+    delta_fixed = 0.0
+    if counts[l] == 0:
+        delta_fixed += fixed_costs[l]
+    if counts[k] == 1:
+        delta_fixed -= fixed_costs[k]
+
+    demand_j = demands[j]
+    load_k, load_l = load[k], load[l]
+    delta_violation = (
+        max(load_k - demand_j - capacities[k], 0.0) - max(load_k - capacities[k], 0.0)
+        + max(load_l + demand_j - capacities[l], 0.0) - max(load_l - capacities[l], 0.0)
+    )
+    new_violation = cur_viol + delta_violation
+
+    new_obj = (cur_fixed + delta_fixed) + (cur_assign + delta_assign) + alpha * new_violation
+    return new_obj, new_violation
+
+
+def _eval_swap(j1, j2, k, l, demands, capacities, costs_T, load,
+               alpha, cur_viol, cur_fixed, cur_assign):
+    """
+    Score swapping customers j1 (at k) and j2 (at l); both facilities stay
+    open, so there is no fixed-cost term. Returns
+    (new_objective, new_total_violation).
+    """
+    delta_assign = (
+        (costs_T[j1, l] - costs_T[j1, k]) + (costs_T[j2, k] - costs_T[j2, l])
+    )
+
+    d1, d2 = demands[j1], demands[j2]
+    load_k, load_l = load[k], load[l]
+    load_k_new = load_k - d1 + d2
+    load_l_new = load_l - d2 + d1
+    delta_violation = (
+        max(load_k_new - capacities[k], 0.0) - max(load_k - capacities[k], 0.0)
+        + max(load_l_new - capacities[l], 0.0) - max(load_l - capacities[l], 0.0)
+    )
+    new_violation = cur_viol + delta_violation
+
+    new_obj = cur_fixed + (cur_assign + delta_assign) + alpha * new_violation
+    return new_obj, new_violation
+
+
+if NUMBA_AVAILABLE:
+    _eval_relocate = njit(cache=True)(_eval_relocate)
+    _eval_swap = njit(cache=True)(_eval_swap)
+
+
+@dataclass(slots=True)
+class TabuState:
+    """
+    Mutable struct-of-arrays search state. Slots make every field access a
+    C-level attribute fetch instead of a string-hashed dict lookup, which
+    matters because the hot functions touch half a dozen fields per call.
+    """
+
+    assignments: List[int]
+    open_mask: np.ndarray
+    counts: np.ndarray
+    load: np.ndarray
+    total_fixed_cost: float
+    total_assignment_cost: float
+    total_violation: float
+    objective: float
+    is_feasible: bool
+    lower_bound: Optional[float] = None
+
+    @property
+    def open_facilities(self) -> List[int]:
+        """Sorted open facility indices, derived from the mask on demand."""
+        return np.flatnonzero(self.open_mask).tolist()
+
+
+# Placeholder admissibility mask handed to the compiled kernel when
+# pruning is off; never read in that case.
+_NO_PRUNE = np.ones((1, 1), dtype=bool)
+
+# Candidate block size for the short-circuiting selector strategies:
+# large enough to keep the batched scorers efficient, small enough that
+# an early stop actually skips most of the neighborhood.
+_SELECTOR_BLOCK = 256
+
+
+def _run_single_start(payload):
+    """
+    Process-pool worker: rebuild a search from plain arrays and run one
+    seeded start. Module-level so it pickles cleanly.
+    """
+    (capacities, demands, fixed_costs, assignment_costs,
+     params, initial_solution, lower_bound, seed) = payload
+    search = SSCFLPTabuSearch(
+        capacities, demands, fixed_costs, assignment_costs,
+        random_seed=seed, **params,
+    )
+    return search.run(initial_solution, lower_bound=lower_bound, verbose=False)
+
 
 class SSCFLPTabuSearch:
     """
@@ -25,14 +142,41 @@ class SSCFLPTabuSearch:
         max_stagnation: int = 40,
         tabu_tenure_min: int = 10,
         tabu_tenure_max: int = 30,
+        n_nearest: int | None = None,
+        selector_strategy: str = "best",
         random_seed: int | None = None,
     ) -> None:
         self.m = len(capacities)
         self.n = len(demands)
-        self.capacities = capacities
-        self.demands = demands
-        self.fixed_costs = fixed_costs
-        self.assignment_costs = assignment_costs
+        # Canonical C-contiguous float64 copies so the vectorized and njit
+        # paths never hit a dtype conversion mid-loop.
+        self.capacities = np.ascontiguousarray(capacities, dtype=np.float64)
+        self.demands = np.ascontiguousarray(demands, dtype=np.float64)
+        self.fixed_costs = np.ascontiguousarray(fixed_costs, dtype=np.float64)
+        self.assignment_costs = np.ascontiguousarray(assignment_costs, dtype=np.float64)
+        # Customer-major (n x m) copy: the hot paths compare two facilities
+        # for a fixed customer, which is a strided row walk in the (m x n)
+        # layout but a contiguous fetch here.
+        self.assignment_costs_T = np.ascontiguousarray(self.assignment_costs.T)
+        # Half-width scratch copy for the batched scorers: the candidate
+        # gathers are bandwidth-bound, and float32 halves the bytes moved.
+        # Deltas are upcast before touching the float64 running totals, so
+        # the objective itself never accumulates in reduced precision.
+        self.assignment_costs_T32 = self.assignment_costs_T.astype(np.float32)
+        # Plain-list views for scalar fetches in the remaining Python-level
+        # paths: list indexing yields native floats, skipping the NumPy
+        # 0-d scalar boxing on every access.
+        self._demands_list = self.demands.tolist()
+        self._caps_list = self.capacities.tolist()
+        self._fixed_list = self.fixed_costs.tolist()
+        # Per-customer facility preference order (ascending assignment
+        # cost). Reassignment after a perturbation walks this list until it
+        # hits an open facility, so the one-time sort here is amortized
+        # over every perturbation and greedy-drop trial.
+        self._pref_order = np.argsort(
+            self.assignment_costs_T, axis=1, kind="stable"
+        ).astype(np.int32)
+        self._pref_lists = self._pref_order.tolist()
 
         self.max_iterations = max_iterations
         self.alpha = alpha
@@ -41,15 +185,69 @@ class SSCFLPTabuSearch:
         self.max_stagnation = max_stagnation
         self.tabu_tenure_min = tabu_tenure_min
         self.tabu_tenure_max = tabu_tenure_max
+        # Optional relocate pruning: only each customer's n_nearest
+        # cheapest facilities (plus anything already open) are scored.
+        # None keeps the exhaustive neighborhood.
+        self.n_nearest = n_nearest
+        # How the move selector spends its evaluation budget: "best"
+        # scores the whole sampled neighborhood every iteration, while
+        # "first_improving" and "first_k" evaluate candidates in blocks
+        # and stop as soon as an improving feasible move turns up.
+        if selector_strategy not in ("best", "first_improving", "first_k"):
+            raise ValueError(f"Unknown selector_strategy: {selector_strategy!r}")
+        self.selector_strategy = selector_strategy
         self.rng = random.Random(random_seed)
-
-        # Tabu structure: (customer, previous_facility) -> expiration iteration
-        self.tabu_dict: Dict[Tuple[int, int], int] = {}
+        self._log_every = 100
+        # Circular pool of pre-drawn base tenures: tabu updates happen up
+        # to twice per iteration and a list index is much cheaper than a
+        # random.Random.randint call each time.
+        self._tenure_pool = np.random.default_rng(random_seed).integers(
+            tabu_tenure_min, tabu_tenure_max + 1, size=max(1, 4 * max_iterations)
+        ).tolist()
+        self._tenure_idx = 0
+
+        # Tabu structure: expiration iteration per (customer, previous
+        # facility) attribute; a dense array so whole candidate batches can
+        # be filtered with one fancy-indexed compare.
+        self.tabu_expiry = np.full((self.n, self.m), -1, dtype=np.int32)
+        if KERNELS_AVAILABLE:
+            # One throwaway call compiles (or loads the cached build of)
+            # the fused relocate kernel before the timed search starts.
+            score_relocates(
+                np.zeros(1, dtype=np.intp), np.zeros(self.n, dtype=np.intp),
+                _NO_PRUNE, False,
+                self.demands, self.capacities, self.fixed_costs,
+                self.assignment_costs_T, np.zeros(self.m),
+                np.zeros(self.m, dtype=np.int64),
+                np.full((self.n, self.m), -1, dtype=np.int32),
+                0, self.alpha, 0.0, 0.0, 0.0, float("inf"),
+            )
+            score_swaps(
+                np.zeros(1, dtype=np.intp), np.zeros(1, dtype=np.intp),
+                np.zeros(1, dtype=np.intp), np.zeros(1, dtype=np.intp),
+                self.demands, self.capacities, self.assignment_costs_T,
+                np.zeros(self.m),
+                np.full((self.n, self.m), -1, dtype=np.int32),
+                0, self.alpha, 0.0, 0.0, 0.0, float("inf"),
+            )
+        # Greedy reassignment depends only on the open mask, so results
+        # are memoized by mask signature; greedy-drop trials and repeated
+        # perturbations revisit the same open sets constantly. Bounded LRU
+        # so pathological runs cannot grow it without limit.
+        self._reassign_cache: OrderedDict = OrderedDict()
+        self._reassign_cache_max = 1024
+
+        # Frequency memory for dynamic tenure: how often each attribute was
+        # made tabu, in the same dense (n, m) layout as tabu_expiry, with
+        # its maximum cached incrementally so the tenure computation never
+        # rescans the table.
+        self.move_frequencies = np.zeros((self.n, self.m), dtype=np.int32)
+        self._max_frequency = 0
 
     # ------------------------------------------------------------------ #
     # State helpers                                                      #
     # ------------------------------------------------------------------ #
-    def _build_state(self, initial_solution: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_state(self, initial_solution: Dict[str, Any]) -> TabuState:
         """
         Build an internal mutable state from the given solution dictionary.
         Assumes initial_solution has 'assignments' mapping customer->facility
@@ -63,52 +261,74 @@ class SSCFLPTabuSearch:
         for i in assignments:
             open_set.add(i)
 
-        counts = np.zeros(self.m, dtype=int)
-        load = np.zeros(self.m, dtype=float)
-        for j, i in enumerate(assignments):
-            counts[i] += 1
-            load[i] += self.demands[j]
+        assign_arr = np.asarray(assignments, dtype=np.intp)
+        counts = np.bincount(assign_arr, minlength=self.m)
+        load = np.bincount(assign_arr, weights=self.demands, minlength=self.m)
 
-        fixed_cost = float(sum(self.fixed_costs[i] for i in open_set))
-        assignment_cost = float(sum(self.assignment_costs[assignments[j]][j] for j in range(self.n)))
+        open_arr = np.fromiter(open_set, dtype=np.intp, count=len(open_set))
+        fixed_cost = float(self.fixed_costs[open_arr].sum())
+        assignment_cost = float(self.assignment_costs_T[np.arange(self.n), assign_arr].sum())
         violations = np.maximum(load - self.capacities, 0.0)
         total_violation = float(np.sum(violations))
         objective = fixed_cost + assignment_cost + self.alpha * total_violation
 
-        capacity_violations = {
-            i: float(violations[i]) for i in range(self.m) if violations[i] > 0
-        }
+        open_mask = np.zeros(self.m, dtype=bool)
+        open_mask[open_arr] = True
+
+        return TabuState(
+            assignments=assignments,
+            open_mask=open_mask,
+            counts=counts,
+            load=load,
+            total_fixed_cost=fixed_cost,
+            total_assignment_cost=assignment_cost,
+            total_violation=total_violation,
+            objective=objective,
+            is_feasible=total_violation == 0.0,
+            lower_bound=initial_solution.get("lower_bound"),
+        )
 
+    def _clone_solution(self, solution: TabuState) -> Dict[str, Any]:
+        """
+        Lightweight clone for storing best solutions. The violations dict
+        is derived from the loads here, the only place it is needed.
+        """
+        excess = np.maximum(solution.load - self.capacities, 0.0)
+        violating = np.flatnonzero(excess)
+        capacity_violations = {int(i): float(excess[i]) for i in violating}
         return {
-            "assignments": assignments,  # list[int]
-            "open_facilities": sorted(open_set),
-            "open_set": open_set,
-            "counts": counts,
-            "load": load,
-            "total_fixed_cost": fixed_cost,
-            "total_assignment_cost": assignment_cost,
-            "total_violation": total_violation,
-            "objective": objective,
-            "is_feasible": total_violation == 0.0,
+            "open_facilities": list(solution.open_facilities),
+            # Dense list, not a dict: assignments are a total function over
+            # 0..n-1, so subscripting works unchanged for callers and the
+            # clone is one contiguous copy instead of n dict entries.
+            "assignments": list(solution.assignments),
+            "total_fixed_cost": solution.total_fixed_cost,
+            "total_assignment_cost": solution.total_assignment_cost,
+            "total_cost": solution.total_fixed_cost + solution.total_assignment_cost,
+            "objective": solution.objective,
+            "is_feasible": solution.is_feasible,
             "capacity_violations": capacity_violations,
-            "lower_bound": initial_solution.get("lower_bound"),
+            "lower_bound": solution.lower_bound,
         }
 
-    def _clone_solution(self, solution: Dict[str, Any]) -> Dict[str, Any]:
+    def _full_clone_state(self, solution: TabuState) -> TabuState:
         """
-        Lightweight clone for storing best solutions.
+        Explicit copy of the full internal search state. deepcopy recurses
+        into every array element; this flat structure only needs a shallow
+        copy per field, which is far cheaper on the perturbation path.
         """
-        return {
-            "open_facilities": list(solution["open_facilities"]),
-            "assignments": {j: solution["assignments"][j] for j in range(self.n)},
-            "total_fixed_cost": solution["total_fixed_cost"],
-            "total_assignment_cost": solution["total_assignment_cost"],
-            "total_cost": solution["total_fixed_cost"] + solution["total_assignment_cost"],
-            "objective": solution["objective"],
-            "is_feasible": solution["is_feasible"],
-            "capacity_violations": dict(solution["capacity_violations"]),
-            "lower_bound": solution.get("lower_bound"),
-        }
+        return TabuState(
+            assignments=list(solution.assignments),
+            open_mask=solution.open_mask.copy(),
+            counts=solution.counts.copy(),
+            load=solution.load.copy(),
+            total_fixed_cost=solution.total_fixed_cost,
+            total_assignment_cost=solution.total_assignment_cost,
+            total_violation=solution.total_violation,
+            objective=solution.objective,
+            is_feasible=solution.is_feasible,
+            lower_bound=solution.lower_bound,
+        )
 
     def _update_alpha(self, feasible: bool) -> None:
         """
@@ -125,109 +345,169 @@ class SSCFLPTabuSearch:
     # ------------------------------------------------------------------ #
     # Neighborhood generation                                            #
     # ------------------------------------------------------------------ #
-    def _sample_customers(self) -> List[int]:
+    def _sample_customers(self) -> np.ndarray:
         sample_size = max(1, math.ceil(self.beta * self.n))
-        return self.rng.sample(list(range(self.n)), sample_size)
-
-    def _relocate_moves(self, solution: Dict[str, Any]) -> List[Tuple[str, Tuple[int, int, int]]]:
-        moves = []
-        assignments = solution["assignments"]
-        sampled = self._sample_customers()
-        for j in sampled:
-            k = assignments[j]
-            for l in range(self.m):
-                if l == k:
-                    continue
-                moves.append(("relocate", (j, k, l)))
-        return moves
+        return np.fromiter(
+            self.rng.sample(range(self.n), sample_size),
+            dtype=np.intp, count=sample_size,
+        )
 
-    def _swap_moves(self, solution: Dict[str, Any]) -> List[Tuple[str, Tuple[int, int, int, int]]]:
-        moves = []
-        assignments = solution["assignments"]
+    def _swap_moves(
+        self, solution: TabuState
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Enumerate swap candidates over a customer sample as parallel index
+        arrays (j1, j2, k, l). All unordered pairs come from triu_indices
+        and same-facility pairs are masked out, so there is no Python-level
+        double loop.
+        """
         sampled = self._sample_customers()
-        if len(sampled) < 2:
-            return moves
-        for idx1 in range(len(sampled)):
-            for idx2 in range(idx1 + 1, len(sampled)):
-                j1, j2 = sampled[idx1], sampled[idx2]
-                k, l = assignments[j1], assignments[j2]
-                if k != l:
-                    moves.append(("swap", (j1, j2, k, l)))
-        return moves
+        if sampled.size < 2:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty, empty, empty
+        i1, i2 = np.triu_indices(sampled.size, k=1)
+        j1, j2 = sampled[i1], sampled[i2]
+        assign_arr = np.asarray(solution.assignments, dtype=np.intp)
+        k, l = assign_arr[j1], assign_arr[j2]
+        keep = k != l
+        return j1[keep], j2[keep], k[keep], l[keep]
 
     # ------------------------------------------------------------------ #
     # Delta evaluation                                                   #
     # ------------------------------------------------------------------ #
-    def _delta_violation(self, load_old: float, load_new: float, cap: float) -> float:
-        return max(load_new - cap, 0.0) - max(load_old - cap, 0.0)
+    def _relocate_allowed(
+        self, solution: TabuState, sampled: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """
+        Admissibility mask for relocate targets, or None when pruning is
+        disabled. A facility outside a customer's n_nearest cheapest can
+        only pay off if it is already open, so everything else is dropped
+        before any delta math.
+        """
+        if self.n_nearest is None or self.n_nearest >= self.m:
+            return None
+        allowed = np.zeros((sampled.size, self.m), dtype=bool)
+        allowed |= solution.open_mask
+        near = self._pref_order[sampled, : self.n_nearest]
+        allowed[np.arange(sampled.size)[:, None], near] = True
+        return allowed
+
+    def _evaluate_relocates_batch(
+        self, solution: TabuState, sampled: np.ndarray,
+        allowed: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score every relocate move (j, k, l) for the sampled customers in
+        one vectorized pass. Returns parallel arrays
+        (j_arr, k_arr, l_arr, new_objective, new_total_violation).
+        """
+        assignments = np.asarray(solution.assignments, dtype=np.intp)
+        load = solution.load
+        counts = solution.counts
+        caps = self.capacities
+
+        j_arr = np.repeat(sampled, self.m)
+        l_arr = np.tile(np.arange(self.m, dtype=np.intp), sampled.size)
+        k_arr = assignments[j_arr]
+        keep = l_arr != k_arr
+        if allowed is not None:
+            keep &= allowed.ravel()
+        j_arr, k_arr, l_arr = j_arr[keep], k_arr[keep], l_arr[keep]
+
+        costs_t32 = self.assignment_costs_T32
+        delta_assign = (
+            costs_t32[j_arr, l_arr] - costs_t32[j_arr, k_arr]
+        ).astype(np.float64)
+        delta_fixed = (
+            (counts[l_arr] == 0) * self.fixed_costs[l_arr]
+            - (counts[k_arr] == 1) * self.fixed_costs[k_arr]
+        )
+
+        demand = self.demands[j_arr]
+        load_k, load_l = load[k_arr], load[l_arr]
+        delta_violation = (
+            np.maximum(load_k - demand - caps[k_arr], 0.0)
+            - np.maximum(load_k - caps[k_arr], 0.0)
+            + np.maximum(load_l + demand - caps[l_arr], 0.0)
+            - np.maximum(load_l - caps[l_arr], 0.0)
+        )
+        new_violation = solution.total_violation + delta_violation
+
+        new_obj = (
+            (solution.total_fixed_cost + delta_fixed)
+            + (solution.total_assignment_cost + delta_assign)
+            + self.alpha * new_violation
+        )
+        return j_arr, k_arr, l_arr, new_obj, new_violation
+
+    def _evaluate_swaps_batch(
+        self,
+        solution: TabuState,
+        j1: np.ndarray,
+        j2: np.ndarray,
+        k: np.ndarray,
+        l: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score every swap candidate (j1 at k, j2 at l) in one vectorized
+        pass; both facilities stay open, so there is no fixed-cost term.
+        Returns parallel (new_objective, new_total_violation) arrays.
+        """
+        costs_t32 = self.assignment_costs_T32
+        load = solution.load
+
+        delta_assign = (
+            (costs_t32[j1, l] - costs_t32[j1, k]) + (costs_t32[j2, k] - costs_t32[j2, l])
+        ).astype(np.float64)
+
+        d1, d2 = self.demands[j1], self.demands[j2]
+        load_k, load_l = load[k], load[l]
+        cap_k, cap_l = self.capacities[k], self.capacities[l]
+        delta_violation = (
+            np.maximum(load_k - d1 + d2 - cap_k, 0.0)
+            - np.maximum(load_k - cap_k, 0.0)
+            + np.maximum(load_l - d2 + d1 - cap_l, 0.0)
+            - np.maximum(load_l - cap_l, 0.0)
+        )
+        new_violation = solution.total_violation + delta_violation
+
+        new_obj = (
+            solution.total_fixed_cost
+            + (solution.total_assignment_cost + delta_assign)
+            + self.alpha * new_violation
+        )
+        return new_obj, new_violation
 
     def _evaluate_move_delta(
-        self, solution: Dict[str, Any], move: Tuple[str, Tuple]
+        self, solution: TabuState, move: Tuple[str, Tuple]
     ) -> Tuple[float, bool, float]:
         """
         Returns (new_objective, new_feasible, delta_objective)
-        without modifying the solution.
+        without modifying the solution. The arithmetic lives in the
+        module-level _eval_relocate/_eval_swap helpers, which numba
+        compiles when available.
         """
         move_type, data = move
-        assignments = solution["assignments"]
-        load = solution["load"]
-        counts = solution["counts"]
-
-        current_obj = solution["objective"]
-        current_violation = solution["total_violation"]
-        current_fixed = solution["total_fixed_cost"]
-        current_assign_cost = solution["total_assignment_cost"]
+        current_obj = solution.objective
 
         if move_type == "relocate":
             j, k, l = data
-            demand_j = self.demands[j]
-
-            delta_assign = float(self.assignment_costs[l][j] - self.assignment_costs[k][j])
-
-            # Fixed cost delta (strong linking)
-            delta_fixed = 0.0
-            k_will_empty = counts[k] == 1
-            l_closed_now = counts[l] == 0
-            if l_closed_now:
-                delta_fixed += float(self.fixed_costs[l])
-            if k_will_empty:
-                delta_fixed -= float(self.fixed_costs[k])
-
-            # Violation delta only on k and l
-            load_k_old, load_l_old = load[k], load[l]
-            load_k_new = load_k_old - demand_j
-            load_l_new = load_l_old + demand_j
-            delta_violation = self._delta_violation(load_k_old, load_k_new, self.capacities[k])
-            if l != k:
-                delta_violation += self._delta_violation(load_l_old, load_l_new, self.capacities[l])
-            new_violation = current_violation + delta_violation
-
-            new_assign_cost = current_assign_cost + delta_assign
-            new_fixed = current_fixed + delta_fixed
-            new_obj = new_fixed + new_assign_cost + self.alpha * new_violation
+            new_obj, new_violation = _eval_relocate(
+                j, k, l, self.demands, self.capacities,
+                self.assignment_costs_T, solution.load, solution.counts,
+                self.fixed_costs, self.alpha, solution.total_violation,
+                solution.total_fixed_cost, solution.total_assignment_cost,
+            )
             return new_obj, new_violation == 0.0, new_obj - current_obj
 
         elif move_type == "swap":
             j1, j2, k, l = data
-            d1, d2 = self.demands[j1], self.demands[j2]
-
-            delta_assign = float(
-                (self.assignment_costs[l][j1] - self.assignment_costs[k][j1])
-                + (self.assignment_costs[k][j2] - self.assignment_costs[l][j2])
+            new_obj, new_violation = _eval_swap(
+                j1, j2, k, l, self.demands, self.capacities,
+                self.assignment_costs_T, solution.load,
+                self.alpha, solution.total_violation,
+                solution.total_fixed_cost, solution.total_assignment_cost,
             )
-            delta_fixed = 0.0  # k and l stay open
-
-            load_k_old, load_l_old = load[k], load[l]
-            load_k_new = load_k_old - d1 + d2
-            load_l_new = load_l_old - d2 + d1
-            delta_violation = self._delta_violation(load_k_old, load_k_new, self.capacities[k])
-            if l != k:
-                delta_violation += self._delta_violation(load_l_old, load_l_new, self.capacities[l])
-            new_violation = current_violation + delta_violation
-
-            new_assign_cost = current_assign_cost + delta_assign
-            new_fixed = current_fixed + delta_fixed
-            new_obj = new_fixed + new_assign_cost + self.alpha * new_violation
             return new_obj, new_violation == 0.0, new_obj - current_obj
 
         return float("inf"), False, float("inf")
@@ -235,251 +515,238 @@ class SSCFLPTabuSearch:
     # ------------------------------------------------------------------ #
     # Move application in-place                                          #
     # ------------------------------------------------------------------ #
-    def _apply_move_in_place(self, solution: Dict[str, Any], move: Tuple[str, Tuple]) -> None:
+    def _apply_move_in_place(self, solution: TabuState, move: Tuple[str, Tuple]) -> None:
         move_type, data = move
-        assignments = solution["assignments"]
-        load = solution["load"]
-        counts = solution["counts"]
+        assignments = solution.assignments
+        load = solution.load
+        counts = solution.counts
 
         if move_type == "relocate":
             j, k, l = data
-            demand_j = self.demands[j]
+            demand_j = self._demands_list[j]
 
             # Update assignment cost
-            delta_assign = float(self.assignment_costs[l][j] - self.assignment_costs[k][j])
-            solution["total_assignment_cost"] += delta_assign
+            delta_assign = self.assignment_costs_T[j, l] - self.assignment_costs_T[j, k]
+            solution.total_assignment_cost += delta_assign
 
-            # Update fixed cost / open set
+            # Update fixed cost / open mask
             l_closed_before = counts[l] == 0
             k_will_empty = counts[k] == 1
             if l_closed_before:
-                solution["total_fixed_cost"] += float(self.fixed_costs[l])
-                solution["open_set"].add(l)
-                solution["open_facilities"].append(l)
+                solution.total_fixed_cost += self._fixed_list[l]
+                solution.open_mask[l] = True
             assignments[j] = l
             counts[k] -= 1
             counts[l] += 1
             if k_will_empty:
-                solution["total_fixed_cost"] -= float(self.fixed_costs[k])
-                solution["open_set"].discard(k)
-                solution["open_facilities"] = [f for f in solution["open_facilities"] if f != k]
+                solution.total_fixed_cost -= self._fixed_list[k]
+                solution.open_mask[k] = False
 
             # Update loads and violation
             load_k_old, load_l_old = load[k], load[l]
             load[k] -= demand_j
             load[l] += demand_j
-            delta_violation = self._delta_violation(load_k_old, load[k], self.capacities[k])
+            cap_k, cap_l = self._caps_list[k], self._caps_list[l]
+            delta_violation = max(load[k] - cap_k, 0.0) - max(load_k_old - cap_k, 0.0)
             if l != k:
-                delta_violation += self._delta_violation(load_l_old, load[l], self.capacities[l])
-            solution["total_violation"] += delta_violation
+                delta_violation += max(load[l] - cap_l, 0.0) - max(load_l_old - cap_l, 0.0)
+            solution.total_violation += delta_violation
 
         elif move_type == "swap":
             j1, j2, k, l = data
-            d1, d2 = self.demands[j1], self.demands[j2]
+            d1, d2 = self._demands_list[j1], self._demands_list[j2]
 
-            delta_assign = float(
-                (self.assignment_costs[l][j1] - self.assignment_costs[k][j1])
-                + (self.assignment_costs[k][j2] - self.assignment_costs[l][j2])
+            delta_assign = (
+                (self.assignment_costs_T[j1, l] - self.assignment_costs_T[j1, k])
+                + (self.assignment_costs_T[j2, k] - self.assignment_costs_T[j2, l])
             )
-            solution["total_assignment_cost"] += delta_assign
+            solution.total_assignment_cost += delta_assign
 
             # No fixed cost change; counts unchanged
             load_k_old, load_l_old = load[k], load[l]
             load[k] = load_k_old - d1 + d2
             load[l] = load_l_old - d2 + d1
-            delta_violation = self._delta_violation(load_k_old, load[k], self.capacities[k])
+            cap_k, cap_l = self._caps_list[k], self._caps_list[l]
+            delta_violation = max(load[k] - cap_k, 0.0) - max(load_k_old - cap_k, 0.0)
             if l != k:
-                delta_violation += self._delta_violation(load_l_old, load[l], self.capacities[l])
-            solution["total_violation"] += delta_violation
+                delta_violation += max(load[l] - cap_l, 0.0) - max(load_l_old - cap_l, 0.0)
+            solution.total_violation += delta_violation
 
             assignments[j1], assignments[j2] = l, k
 
-        # Recompute objective and feasibility
-        solution["objective"] = (
-            solution["total_fixed_cost"]
-            + solution["total_assignment_cost"]
-            + self.alpha * solution["total_violation"]
+        # Recompute objective and feasibility; the one float() here keeps
+        # the stored scalar a native Python float without coercing every
+        # intermediate element read above.
+        solution.objective = float(
+            solution.total_fixed_cost
+            + solution.total_assignment_cost
+            + self.alpha * solution.total_violation
         )
-        solution["is_feasible"] = solution["total_violation"] == 0.0
-
-        # Refresh capacity violations dictionary only for changed facilities
-        viol = solution["capacity_violations"]
-        if move_type == "relocate":
-            for i in {k, l}:
-                excess = solution["load"][i] - self.capacities[i]
-                if excess > 0:
-                    viol[i] = float(excess)
-                elif i in viol:
-                    del viol[i]
-        else:
-            for i in {k, l}:
-                excess = solution["load"][i] - self.capacities[i]
-                if excess > 0:
-                    viol[i] = float(excess)
-                elif i in viol:
-                    del viol[i]
-
-        solution["open_facilities"].sort()
+        solution.is_feasible = solution.total_violation == 0.0
 
     # ------------------------------------------------------------------ #
     # Tabu handling with dynamic tenure                                  #
     # ------------------------------------------------------------------ #
-    def _is_tabu(self, move: Tuple[str, Tuple], iteration: int) -> bool:
-        move_type, data = move
-        if move_type == "relocate":
-            j, k, _ = data
-            expiry = self.tabu_dict.get((j, k), -1)
-            return iteration < expiry
-        elif move_type == "swap":
-            j1, j2, k, l = data
-            return iteration < self.tabu_dict.get((j1, k), -1) or iteration < self.tabu_dict.get((j2, l), -1)
-        return False
-
-    def _get_tabu_tenure(self) -> int:
+    def _get_tabu_tenure(self, attribute: Tuple[int, int]) -> int:
         """
-        Simple randomized static tabu tenure.
-        Returns a random tenure value within the specified range.
+        Frequency-based dynamic tabu tenure: a pre-drawn random base
+        within the configured range, lengthened for attributes that keep
+        recurring. The cached maximum frequency normalizes the bonus in
+        O(1).
         """
-        return self.rng.randint(self.tabu_tenure_min, self.tabu_tenure_max)
+        tenure = self._tenure_pool[self._tenure_idx]
+        self._tenure_idx = (self._tenure_idx + 1) % len(self._tenure_pool)
+        if self._max_frequency > 0:
+            freq = int(self.move_frequencies[attribute])
+            spread = self.tabu_tenure_max - self.tabu_tenure_min
+            tenure += int(spread * freq / self._max_frequency)
+        return tenure
 
     def _update_tabu(self, move: Tuple[str, Tuple], iteration: int) -> None:
         move_type, data = move
-        tenure = self._get_tabu_tenure()
         if move_type == "relocate":
-            j, k, l = data
-            self.tabu_dict[(j, k)] = iteration + tenure
+            j, k, _ = data
+            attributes = ((j, k),)
         elif move_type == "swap":
             j1, j2, k, l = data
-            self.tabu_dict[(j1, k)] = iteration + tenure
-            self.tabu_dict[(j2, l)] = iteration + tenure
+            attributes = ((j1, k), (j2, l))
+        else:
+            return
+        for attribute in attributes:
+            freq = int(self.move_frequencies[attribute]) + 1
+            self.move_frequencies[attribute] = freq
+            if freq > self._max_frequency:
+                self._max_frequency = freq
+            self.tabu_expiry[attribute] = iteration + self._get_tabu_tenure(attribute)
 
     # ------------------------------------------------------------------ #
     # Perturbation operators (Section 3.3)                               #
     # ------------------------------------------------------------------ #
-    def _reassign_all_to_open(self, solution: Dict[str, Any]) -> None:
-        open_f = solution["open_facilities"]
-        assignments = solution["assignments"]
-        counts = solution["counts"]
-        load = solution["load"]
-
-        counts.fill(0)
-        load.fill(0.0)
-        assign_cost = 0.0
-
-        for j in range(self.n):
-            costs = [(self.assignment_costs[i][j], i) for i in open_f]
-            _, best_i = min(costs, key=lambda x: x[0])
-            assignments[j] = best_i
-            counts[best_i] += 1
-            load[best_i] += self.demands[j]
-            assign_cost += self.assignment_costs[best_i][j]
-
-        solution["total_assignment_cost"] = assign_cost
-        violations = np.maximum(load - self.capacities, 0.0)
-        solution["total_violation"] = float(np.sum(violations))
-        solution["capacity_violations"] = {i: float(violations[i]) for i in range(self.m) if violations[i] > 0}
-        solution["total_fixed_cost"] = float(sum(self.fixed_costs[i] for i in open_f))
-        solution["objective"] = (
-            solution["total_fixed_cost"] + solution["total_assignment_cost"] + self.alpha * solution["total_violation"]
-        )
-        solution["is_feasible"] = solution["total_violation"] == 0.0
-
-    def _op1_close(self, new_sol: Dict[str, Any]) -> None:
-        open_set = set(new_sol["open_facilities"])
-        if len(open_set) > 1:
-            open_set.remove(self.rng.choice(list(open_set)))
-        new_sol["open_facilities"] = sorted(open_set)
-        new_sol["open_set"] = set(open_set)
-
-    def _op2_open(self, new_sol: Dict[str, Any]) -> None:
-        open_set = set(new_sol["open_facilities"])
-        closed = [i for i in range(self.m) if i not in open_set]
-        if closed:
-            open_set.add(self.rng.choice(closed))
-        new_sol["open_facilities"] = sorted(open_set)
-        new_sol["open_set"] = set(open_set)
-
-    def _op3_swap_open_close(self, new_sol: Dict[str, Any]) -> None:
-        open_set = set(new_sol["open_facilities"])
-        closed = [i for i in range(self.m) if i not in open_set]
-        if open_set and closed:
-            open_set.remove(self.rng.choice(list(open_set)))
-            open_set.add(self.rng.choice(closed))
-        new_sol["open_facilities"] = sorted(open_set)
-        new_sol["open_set"] = set(open_set)
-
-    def _op4_shuffle_assignments(self, new_sol: Dict[str, Any]) -> None:
-        # Keep open set; perform a random assignment to diversify
-        open_set = set(new_sol["open_facilities"])
-        assignments = new_sol["assignments"]
-        counts = new_sol["counts"]
-        load = new_sol["load"]
-
-        counts.fill(0)
-        load.fill(0.0)
-        assign_cost = 0.0
-
-        if not open_set:
-            return
-        open_list = list(open_set)
-        for j in range(self.n):
-            i = self.rng.choice(open_list)
-            assignments[j] = i
-            counts[i] += 1
-            load[i] += self.demands[j]
-            assign_cost += self.assignment_costs[i][j]
-
-        new_sol["open_facilities"] = sorted(open_set)
-        new_sol["open_set"] = set(open_set)
-        # finalize costs/violations
-        self._reassign_all_to_open(new_sol)
+    def _reassign_all_to_open(self, solution: TabuState) -> None:
+        open_mask = solution.open_mask
+
+        key = open_mask.tobytes()
+        cached = self._reassign_cache.get(key)
+        if cached is not None:
+            self._reassign_cache.move_to_end(key)
+            (assignments, counts, load, assign_cost,
+             total_violation, fixed_cost) = cached
+            solution.assignments = list(assignments)
+            solution.counts = counts.copy()
+            solution.load = load.copy()
+            solution.total_assignment_cost = assign_cost
+            solution.total_violation = total_violation
+            solution.total_fixed_cost = fixed_cost
+        else:
+            mask_list = open_mask.tolist()
+
+            # Nearest open facility for every customer: walk the precomputed
+            # preference order and stop at the first open one, which is O(1)
+            # expected per customer instead of a scan over all open columns.
+            assignments = [0] * self.n
+            pref_lists = self._pref_lists
+            for j in range(self.n):
+                for i in pref_lists[j]:
+                    if mask_list[i]:
+                        assignments[j] = i
+                        break
+
+            best = np.asarray(assignments, dtype=np.intp)
+            solution.assignments = assignments
+            solution.counts = np.bincount(best, minlength=self.m)
+            load = np.bincount(best, weights=self.demands, minlength=self.m)
+            solution.load = load
+            assign_cost = float(self.assignment_costs_T[np.arange(self.n), best].sum())
+
+            solution.total_assignment_cost = assign_cost
+            violations = np.maximum(load - self.capacities, 0.0)
+            solution.total_violation = float(np.sum(violations))
+            solution.total_fixed_cost = float(self.fixed_costs[open_mask].sum())
+
+            self._reassign_cache[key] = (
+                list(assignments), solution.counts.copy(), load.copy(),
+                assign_cost, solution.total_violation,
+                solution.total_fixed_cost,
+            )
+            if len(self._reassign_cache) > self._reassign_cache_max:
+                self._reassign_cache.popitem(last=False)
 
-    def _op5_close_half(self, new_sol: Dict[str, Any]) -> None:
-        open_set = set(new_sol["open_facilities"])
-        if len(open_set) > 1:
-            k = max(1, len(open_set) // 2)
-            to_close = self.rng.sample(list(open_set), k=k)
-            for f in to_close:
-                if len(open_set) > 1:
-                    open_set.discard(f)
-        new_sol["open_facilities"] = sorted(open_set)
-        new_sol["open_set"] = set(open_set)
-
-    def _op6_close1_open2(self, new_sol: Dict[str, Any]) -> None:
-        open_set = set(new_sol["open_facilities"])
-        closed = [i for i in range(self.m) if i not in open_set]
-        if open_set:
-            open_set.discard(self.rng.choice(list(open_set)))
-        if closed:
-            add_count = min(2, len(closed))
-            open_set.update(self.rng.sample(closed, k=add_count))
-        new_sol["open_facilities"] = sorted(open_set)
-        new_sol["open_set"] = set(open_set)
-
-    def _op7_open1_close2(self, new_sol: Dict[str, Any]) -> None:
-        open_set = set(new_sol["open_facilities"])
-        closed = [i for i in range(self.m) if i not in open_set]
-        if closed:
-            open_set.add(self.rng.choice(closed))
-        close_count = min(2, max(0, len(open_set) - 1))
+        # alpha drifts between calls, so the penalized objective is always
+        # recomputed outside the cache.
+        solution.objective = (
+            solution.total_fixed_cost + solution.total_assignment_cost + self.alpha * solution.total_violation
+        )
+        solution.is_feasible = solution.total_violation == 0.0
+
+    def _op1_close(self, new_sol: TabuState) -> None:
+        mask = new_sol.open_mask
+        open_idx = np.flatnonzero(mask)
+        if open_idx.size > 1:
+            mask[open_idx[self.rng.randrange(open_idx.size)]] = False
+
+    def _op2_open(self, new_sol: TabuState) -> None:
+        mask = new_sol.open_mask
+        closed = np.flatnonzero(~mask)
+        if closed.size:
+            mask[closed[self.rng.randrange(closed.size)]] = True
+
+    def _op3_swap_open_close(self, new_sol: TabuState) -> None:
+        mask = new_sol.open_mask
+        open_idx = np.flatnonzero(mask)
+        closed = np.flatnonzero(~mask)
+        if open_idx.size and closed.size:
+            mask[open_idx[self.rng.randrange(open_idx.size)]] = False
+            mask[closed[self.rng.randrange(closed.size)]] = True
+
+    def _op4_shuffle_assignments(self, new_sol: TabuState) -> None:
+        # Keep the open set as-is: the full reassignment at the end of
+        # perturb() rebuilds assignments greedily from the mask, which is
+        # exactly what the old shuffle-then-reassign sequence reduced to.
+        return
+
+    def _op5_close_half(self, new_sol: TabuState) -> None:
+        mask = new_sol.open_mask
+        open_idx = np.flatnonzero(mask)
+        if open_idx.size > 1:
+            remaining = open_idx.size
+            for t in self.rng.sample(range(open_idx.size), k=max(1, open_idx.size // 2)):
+                if remaining > 1:
+                    mask[open_idx[t]] = False
+                    remaining -= 1
+
+    def _op6_close1_open2(self, new_sol: TabuState) -> None:
+        mask = new_sol.open_mask
+        open_idx = np.flatnonzero(mask)
+        closed = np.flatnonzero(~mask)
+        if open_idx.size:
+            mask[open_idx[self.rng.randrange(open_idx.size)]] = False
+        if closed.size:
+            for t in self.rng.sample(range(closed.size), k=min(2, closed.size)):
+                mask[closed[t]] = True
+
+    def _op7_open1_close2(self, new_sol: TabuState) -> None:
+        mask = new_sol.open_mask
+        closed = np.flatnonzero(~mask)
+        if closed.size:
+            mask[closed[self.rng.randrange(closed.size)]] = True
+        open_idx = np.flatnonzero(mask)
+        close_count = min(2, max(0, open_idx.size - 1))
         if close_count > 0:
-            to_close = self.rng.sample(list(open_set), k=close_count)
-            for f in to_close:
-                if len(open_set) > 1:
-                    open_set.discard(f)
-        new_sol["open_facilities"] = sorted(open_set)
-        new_sol["open_set"] = set(open_set)
+            remaining = open_idx.size
+            for t in self.rng.sample(range(open_idx.size), k=close_count):
+                if remaining > 1:
+                    mask[open_idx[t]] = False
+                    remaining -= 1
 
-    def perturb(self, solution: Dict[str, Any], stagnation_counter: int) -> Dict[str, Any]:
+    def perturb(self, solution: TabuState, stagnation_counter: int) -> TabuState:
         """
         Deterministic perturbation strategy.
         - If stagnation_counter < max_stagnation: Randomly choose from Simple Operators (1-5)
         - Else (stagnation reached): FORCE Operator 7 (Open 1, Close 2) to reduce fixed costs
-        Always uses sets to avoid duplicates and reassigns at the end.
+        Operators flip bits in open_mask; the full reassignment at the end
+        derives everything else from it.
         """
-        new_sol = deepcopy(solution)
-        new_sol["open_facilities"] = sorted(set(new_sol.get("open_facilities", [])))
-        new_sol["open_set"] = set(new_sol["open_facilities"])
+        new_sol = self._full_clone_state(solution)
 
         simple_ops = [
             self._op1_close,
@@ -496,9 +763,7 @@ class SSCFLPTabuSearch:
             op = self._op7_open1_close2
 
         op(new_sol)
-        # Ensure full recomputation and duplicate safety
-        new_sol["open_facilities"] = sorted(set(new_sol.get("open_facilities", [])))
-        new_sol["open_set"] = set(new_sol["open_facilities"])
+        # Full recomputation from the perturbed mask
         self._reassign_all_to_open(new_sol)
         return new_sol
 
@@ -513,23 +778,19 @@ class SSCFLPTabuSearch:
 
         while improved:
             improved = False
-            candidates = list(best["open_facilities"])
             # try higher fixed-cost facilities first
-            candidates.sort(key=lambda f: -self.fixed_costs[f])
+            open_idx = np.flatnonzero(best.open_mask)
+            candidates = open_idx[np.argsort(-self.fixed_costs[open_idx])]
 
             for f in candidates:
-                if len(best["open_facilities"]) <= 1:
+                if int(best.open_mask.sum()) <= 1:
                     continue
 
-                trial = deepcopy(best)
-                open_set = set(trial["open_facilities"])
-                open_set.discard(f)
-                trial["open_facilities"] = sorted(open_set)
-                trial["open_set"] = set(open_set)
-
+                trial = self._full_clone_state(best)
+                trial.open_mask[f] = False
                 self._reassign_all_to_open(trial)
 
-                if trial["is_feasible"] and trial["objective"] < best["objective"]:
+                if trial.is_feasible and trial.objective < best.objective:
                     best = trial
                     improved = True
                     break  # restart with updated best
@@ -545,18 +806,18 @@ class SSCFLPTabuSearch:
         Shows global summary, per-facility usage, and violations.
         """
         open_facilities = solution.get("open_facilities", [])
-        assignments = solution.get("assignments", {})
+        assignments = solution.get("assignments", [])
 
         # Build per-facility customer lists and loads
         facility_customers: Dict[int, List[Tuple[int, float, float]]] = {i: [] for i in open_facilities}
         load = {i: 0.0 for i in open_facilities}
-        for j, i in assignments.items():
+        for j, i in enumerate(assignments):
             if i not in facility_customers:
                 # In case assignment references a facility not marked open
                 facility_customers[i] = []
                 load[i] = 0.0
-            dem_j = float(self.demands[j])
-            cost_ij = float(self.assignment_costs[i][j])
+            dem_j = self._demands_list[j]
+            cost_ij = float(self.assignment_costs_T[j, i])
             facility_customers[i].append((j, dem_j, cost_ij))
             load[i] = load.get(i, 0.0) + dem_j
 
@@ -582,11 +843,11 @@ class SSCFLPTabuSearch:
         print("-" * 60)
 
         for i in sorted(facility_customers.keys()):
-            cap = float(self.capacities[i])
+            cap = self._caps_list[i]
             used = load[i]
             pct = (used / cap * 100) if cap > 0 else 0.0
             custs = facility_customers[i]
-            print(f"FACILITY {i} (Cap: {cap:.2f}, Fixed: {float(self.fixed_costs[i]):.2f})")
+            print(f"FACILITY {i} (Cap: {cap:.2f}, Fixed: {self._fixed_list[i]:.2f})")
             print(f"  Status: OPEN")
             print(f"  Load: {used:.2f} / {cap:.2f} ({pct:.2f}%)")
             print(f"  Assigned Customers (Total: {len(custs)}):")
@@ -607,15 +868,164 @@ class SSCFLPTabuSearch:
     # ------------------------------------------------------------------ #
     # Main loop                                                          #
     # ------------------------------------------------------------------ #
-    def get_neighbors(self, solution: Dict[str, Any]) -> List[Tuple[str, Tuple]]:
-        neighbors = self._relocate_moves(solution) + self._swap_moves(solution)
-        self.rng.shuffle(neighbors)
-        return neighbors
+    def _select_relocate(
+        self,
+        current: TabuState,
+        sampled: np.ndarray,
+        allowed: Optional[np.ndarray],
+        iteration: int,
+        best_feasible_obj: float,
+    ) -> Tuple[Optional[Tuple], float, bool]:
+        """
+        Score one batch of relocate candidates — fused in the compiled
+        kernel when numba is available, otherwise vectorized over
+        candidate arrays — and return the admissible argmin as a
+        (move, objective, feasible) triple. move is None when nothing
+        passes the tabu/aspiration filter.
+        """
+        if KERNELS_AVAILABLE:
+            assign_arr = np.asarray(current.assignments, dtype=np.intp)
+            bj, bk, bl, bobj, bviol = score_relocates(
+                sampled, assign_arr,
+                allowed if allowed is not None else _NO_PRUNE,
+                allowed is not None,
+                self.demands, self.capacities,
+                self.fixed_costs, self.assignment_costs_T,
+                current.load, current.counts, self.tabu_expiry, iteration,
+                self.alpha, current.total_violation,
+                current.total_fixed_cost, current.total_assignment_cost,
+                best_feasible_obj,
+            )
+            if bj >= 0:
+                move = ("relocate", (int(bj), int(bk), int(bl)))
+                return move, float(bobj), bool(bviol == 0.0)
+            return None, float("inf"), False
 
-    def run(self, initial_solution: Dict[str, Any], lower_bound: float | None = None) -> Dict[str, Any]:
+        j_arr, k_arr, l_arr, reloc_obj, reloc_viol = self._evaluate_relocates_batch(
+            current, sampled, allowed
+        )
+        not_tabu = self.tabu_expiry[j_arr, k_arr] <= iteration
+        # Aspiration: allow tabu if it improves best feasible objective
+        aspiration = (reloc_viol == 0.0) & (reloc_obj < best_feasible_obj)
+        admissible = np.flatnonzero(not_tabu | aspiration)
+        if admissible.size:
+            idx = admissible[np.argmin(reloc_obj[admissible])]
+            move = ("relocate", (int(j_arr[idx]), int(k_arr[idx]), int(l_arr[idx])))
+            return move, float(reloc_obj[idx]), bool(reloc_viol[idx] == 0.0)
+        return None, float("inf"), False
+
+    def _select_swap(
+        self,
+        current: TabuState,
+        sj1: np.ndarray,
+        sj2: np.ndarray,
+        sk: np.ndarray,
+        sl: np.ndarray,
+        iteration: int,
+        best_feasible_obj: float,
+    ) -> Tuple[Optional[Tuple], float, bool]:
+        """
+        Score one batch of swap candidates the same batched way as
+        _select_relocate; same (move, objective, feasible) contract.
+        """
+        if KERNELS_AVAILABLE:
+            idx, sobj, sviol = score_swaps(
+                sj1, sj2, sk, sl, self.demands, self.capacities,
+                self.assignment_costs_T, current.load, self.tabu_expiry,
+                iteration, self.alpha, current.total_violation,
+                current.total_fixed_cost, current.total_assignment_cost,
+                best_feasible_obj,
+            )
+            if idx >= 0:
+                move = (
+                    "swap",
+                    (int(sj1[idx]), int(sj2[idx]), int(sk[idx]), int(sl[idx])),
+                )
+                return move, float(sobj), bool(sviol == 0.0)
+            return None, float("inf"), False
+
+        swap_obj, swap_viol = self._evaluate_swaps_batch(current, sj1, sj2, sk, sl)
+        not_tabu = (
+            (self.tabu_expiry[sj1, sk] <= iteration)
+            & (self.tabu_expiry[sj2, sl] <= iteration)
+        )
+        # Aspiration: allow tabu if it improves best feasible objective
+        aspiration = (swap_viol == 0.0) & (swap_obj < best_feasible_obj)
+        admissible = np.flatnonzero(not_tabu | aspiration)
+        if admissible.size:
+            idx = admissible[np.argmin(swap_obj[admissible])]
+            move = (
+                "swap",
+                (int(sj1[idx]), int(sj2[idx]), int(sk[idx]), int(sl[idx])),
+            )
+            return move, float(swap_obj[idx]), bool(swap_viol[idx] == 0.0)
+        return None, float("inf"), False
+
+    def _select_move_early(
+        self,
+        current: TabuState,
+        sampled: np.ndarray,
+        allowed: Optional[np.ndarray],
+        iteration: int,
+        best_feasible_obj: float,
+    ) -> Tuple[Optional[Tuple], float, bool]:
+        """
+        Short-circuiting selector for the non-"best" strategies.
+        Candidates are scored in blocks through the usual batched
+        evaluators; as soon as the blocks seen so far contain a feasible
+        admissible move that improves on the current objective, the best
+        of them is returned and the rest of the neighborhood is skipped.
+        "first_improving" walks relocates one customer at a time, so it
+        stops at the first improving customer; "first_k" uses blocks of
+        roughly _SELECTOR_BLOCK candidates, trading a little more
+        scanning for a better pick. Swaps are only reached when no
+        relocate block produced an improvement.
+        """
+        if self.selector_strategy == "first_improving":
+            step = 1
+        else:
+            step = max(1, _SELECTOR_BLOCK // self.m)
+        target = current.objective
+        best_move: Optional[Tuple] = None
+        best_obj = float("inf")
+        best_feasible = False
+
+        for start in range(0, sampled.size, step):
+            chunk_allowed = None if allowed is None else allowed[start:start + step]
+            move, obj, feasible = self._select_relocate(
+                current, sampled[start:start + step], chunk_allowed,
+                iteration, best_feasible_obj,
+            )
+            if move is not None and obj < best_obj:
+                best_move, best_obj, best_feasible = move, obj, feasible
+            if best_feasible and best_obj < target:
+                return best_move, best_obj, best_feasible
+
+        sj1, sj2, sk, sl = self._swap_moves(current)
+        for start in range(0, sj1.size, _SELECTOR_BLOCK):
+            end = start + _SELECTOR_BLOCK
+            move, obj, feasible = self._select_swap(
+                current, sj1[start:end], sj2[start:end],
+                sk[start:end], sl[start:end],
+                iteration, best_feasible_obj,
+            )
+            if move is not None and obj < best_obj:
+                best_move, best_obj, best_feasible = move, obj, feasible
+            if best_feasible and best_obj < target:
+                return best_move, best_obj, best_feasible
+        return best_move, best_obj, best_feasible
+
+    def run(
+        self,
+        initial_solution: Dict[str, Any],
+        lower_bound: float | None = None,
+        verbose: bool = True,
+    ) -> Dict[str, Any]:
         """
         Run Iterated Tabu Search starting from an initial solution dictionary.
-        Returns the best feasible solution found.
+        Returns the best feasible solution found. Progress lines are
+        buffered and written once at the end (suppressed if verbose=False),
+        keeping stdout flushes out of the main loop.
         """
         # If a manual lower bound is provided, inject it before building state
         if lower_bound is not None:
@@ -623,52 +1033,70 @@ class SSCFLPTabuSearch:
             initial_solution["lower_bound"] = lower_bound
 
         current = self._build_state(initial_solution)
-        best_feasible = self._clone_solution(current) if current["is_feasible"] else None
-        best_feasible_obj = current["objective"] if current["is_feasible"] else float("inf")
+        best_feasible = self._clone_solution(current) if current.is_feasible else None
+        best_feasible_obj = current.objective if current.is_feasible else float("inf")
         stagnation = 0
+        log_lines: List[str] = []
+
+        # Hoist the per-iteration bound-method lookups into locals:
+        # LOAD_FAST is markedly cheaper than LOAD_ATTR, and each of these
+        # runs every iteration.
+        sample_customers = self._sample_customers
+        relocate_allowed = self._relocate_allowed
+        select_relocate = self._select_relocate
+        select_swap = self._select_swap
+        select_move_early = self._select_move_early
+        swap_moves = self._swap_moves
+        apply_move = self._apply_move_in_place
+        update_tabu = self._update_tabu
+        update_alpha = self._update_alpha
+        best_only = self.selector_strategy == "best"
 
         for it in range(self.max_iterations):
-            if it % 100 == 0:
-                print(
-                    f"Iter {it}: Obj={current['objective']:.2f}, "
-                    f"Feasible={current['is_feasible']}, "
-                    f"Open={len(current['open_facilities'])}, "
-                    f"Viol={current['total_violation']:.2f}"
+            if verbose and it % self._log_every == 0:
+                log_lines.append(
+                    f"Iter {it}: Obj={current.objective:.2f}, "
+                    f"Feasible={current.is_feasible}, "
+                    f"Open={int(current.open_mask.sum())}, "
+                    f"Viol={current.total_violation:.2f}\n"
                 )
 
-            neighbors = self.get_neighbors(current)
-            if not neighbors:
-                break
-
-            best_move = None
-            best_move_obj = float("inf")
-            best_move_feasible = False
-
-            for move in neighbors:
-                tabu = self._is_tabu(move, it)
-                new_obj, new_feasible, _ = self._evaluate_move_delta(current, move)
-
-                # Aspiration: allow tabu if it improves best feasible objective
-                if tabu and not (new_feasible and new_obj < best_feasible_obj):
-                    continue
-
-                if new_obj < best_move_obj:
-                    best_move = move
-                    best_move_obj = new_obj
-                    best_move_feasible = new_feasible
+            # Relocates and swaps: scoring, the tabu filter, and
+            # aspiration all run in one pass per batch. "best" scans the
+            # whole sampled neighborhood; the other strategies stop as
+            # soon as an improving feasible move is in hand.
+            sampled = sample_customers()
+            allowed = relocate_allowed(current, sampled)
+            if best_only:
+                best_move, best_move_obj, best_move_feasible = select_relocate(
+                    current, sampled, allowed, it, best_feasible_obj
+                )
+                sj1, sj2, sk, sl = swap_moves(current)
+                if sj1.size:
+                    smove, sobj, sfeas = select_swap(
+                        current, sj1, sj2, sk, sl, it, best_feasible_obj
+                    )
+                    if smove is not None and sobj < best_move_obj:
+                        best_move, best_move_obj, best_move_feasible = (
+                            smove, sobj, sfeas,
+                        )
+            else:
+                best_move, best_move_obj, best_move_feasible = select_move_early(
+                    current, sampled, allowed, it, best_feasible_obj
+                )
 
             if best_move is None:
                 break
 
             # Apply selected move in place
-            self._apply_move_in_place(current, best_move)
-            self._update_tabu(best_move, it)
-            self._update_alpha(current["is_feasible"])
+            apply_move(current, best_move)
+            update_tabu(best_move, it)
+            update_alpha(current.is_feasible)
 
             # Track best feasible
-            if current["is_feasible"] and current["objective"] < best_feasible_obj:
+            if current.is_feasible and current.objective < best_feasible_obj:
                 best_feasible = self._clone_solution(current)
-                best_feasible_obj = current["objective"]
+                best_feasible_obj = current.objective
                 stagnation = 0
             else:
                 stagnation += 1
@@ -678,8 +1106,50 @@ class SSCFLPTabuSearch:
                 current = self.perturb(current, stagnation)
                 stagnation = 0
 
+        if log_lines:
+            sys.stdout.write("".join(log_lines))
+
         if best_feasible is None:
             return self._clone_solution(current)
 
         # Post-process feasible solution by greedily dropping facilities
         return self._greedy_drop(best_feasible)
+
+    def run_multistart(
+        self,
+        initial_solution: Dict[str, Any],
+        n_starts: int = 4,
+        seeds: Optional[List[int]] = None,
+        lower_bound: float | None = None,
+        max_workers: int | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Run n_starts independent seeded searches from the same initial
+        solution in parallel worker processes. Iterated tabu search is
+        embarrassingly parallel across restarts, so this scales nearly
+        linearly with cores. Returns the best feasible result, or the best
+        objective overall if no start found a feasible solution.
+        """
+        if seeds is None:
+            seeds = [self.rng.randrange(2 ** 31) for _ in range(n_starts)]
+        params = {
+            "max_iterations": self.max_iterations,
+            "alpha": self.alpha,
+            "epsilon": self.epsilon,
+            "beta": self.beta,
+            "max_stagnation": self.max_stagnation,
+            "tabu_tenure_min": self.tabu_tenure_min,
+            "tabu_tenure_max": self.tabu_tenure_max,
+            "n_nearest": self.n_nearest,
+            "selector_strategy": self.selector_strategy,
+        }
+        payloads = [
+            (self.capacities, self.demands, self.fixed_costs,
+             self.assignment_costs, params, initial_solution, lower_bound, seed)
+            for seed in seeds
+        ]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_run_single_start, payloads))
+
+        feasible = [r for r in results if r["is_feasible"]]
+        return min(feasible or results, key=lambda r: r["objective"])